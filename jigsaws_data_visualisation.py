@@ -3,18 +3,40 @@ import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 import matplotlib.animation as animation
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+from PIL import Image
 import cv2
+import multiprocessing
 import os
+import subprocess
+import warnings
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
 
+# Per-manipulator kinematics in structure-of-arrays layout, indexed by frame:
+# positions is a C-contiguous (3, F) array whose rows pos_x/pos_y/pos_z are
+# views, so walking frames touches consecutive memory; vel_speed, gripper and
+# time are contiguous 1-D arrays
+ManipulatorData = namedtuple(
+    'ManipulatorData',
+    ['positions', 'pos_x', 'pos_y', 'pos_z', 'vel_speed', 'gripper', 'time']
+)
+
 class JIGSAWS3DVideoGeneratorEnhanced:
     """
     Enhanced JIGSAWS 3D video generator with combined left/right views
     and camera-oriented perspectives for better surgical visualization
     """
 
-    def __init__(self, base_path, subject_id="B001", task="Suturing"):
+    def __init__(self, base_path, subject_id="B001", task="Suturing", render_stride=1):
         """Initialize the enhanced 3D video generator"""
+        if not isinstance(render_stride, int) or render_stride < 1:
+            raise ValueError(f"render_stride must be a positive integer, got {render_stride!r}")
+
         self.base_path = Path(base_path)
         self.subject_id = subject_id
         self.task = task
@@ -26,10 +48,12 @@ class JIGSAWS3DVideoGeneratorEnhanced:
         # Data containers
         self.kinematics_data = None
         self.transcriptions_data = None
+        self.gesture_lut = None
 
         # Video parameters
         self.fps = 30  # JIGSAWS standard frame rate
         self.frame_count = 0
+        self.render_stride = render_stride  # Render every Nth frame; video fps is scaled to match
 
         # 3D plot parameters
         self.trail_length = 150  # Number of previous points to show as trail
@@ -63,7 +87,35 @@ class JIGSAWS3DVideoGeneratorEnhanced:
         # Load kinematics data
         try:
             if self.kinematics_file.exists():
-                self.kinematics_data = np.loadtxt(self.kinematics_file)
+                cache_file = self.kinematics_file.with_suffix('.npy')
+                kinematics = None
+                if (cache_file.exists()
+                        and cache_file.stat().st_mtime >= self.kinematics_file.stat().st_mtime):
+                    # Binary cache is memory-mapped: no text parsing, and only the
+                    # pages actually touched are read from disk
+                    try:
+                        kinematics = np.load(cache_file, mmap_mode='r')
+                        print(f"[OK] Using kinematics cache: {cache_file.name}")
+                    except (OSError, ValueError) as e:
+                        print(f"[WARNING] Ignoring unreadable kinematics cache: {e}")
+
+                if kinematics is None:
+                    # float32 keeps ~7 significant digits, ample for mm-scale positions,
+                    # and halves the memory traffic of the per-frame walk
+                    kinematics = np.loadtxt(self.kinematics_file, dtype=np.float32)
+
+                    # Write to a temporary file and rename it into place, so an
+                    # interrupted run never leaves a truncated cache behind
+                    tmp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+                    try:
+                        with open(tmp_file, 'wb') as f:
+                            np.save(f, kinematics)
+                        os.replace(tmp_file, cache_file)
+                    except OSError as e:
+                        tmp_file.unlink(missing_ok=True)
+                        print(f"[WARNING] Could not write kinematics cache: {e}")
+
+                self.kinematics_data = kinematics
                 self.frame_count = len(self.kinematics_data)
                 print(f"[OK] Loaded kinematics: {self.kinematics_data.shape}")
             else:
@@ -76,34 +128,28 @@ class JIGSAWS3DVideoGeneratorEnhanced:
         # Load transcriptions with G1/G2 format parsing
         try:
             if self.transcriptions_file.exists():
-                transcriptions = []
-                with open(self.transcriptions_file, 'r') as f:
-                    for line_num, line in enumerate(f, 1):
-                        line = line.strip()
-                        if not line:  # Skip empty lines
-                            continue
-
-                        parts = line.split()
-                        if len(parts) >= 3:
-                            try:
-                                # Parse frame numbers
-                                start_frame = int(parts[0])
-                                end_frame = int(parts[1])
-
-                                # Parse gesture ID (handle G1, G2, etc. format)
-                                gesture_str = parts[2]
-                                if gesture_str.startswith('G'):
-                                    gesture_id = int(gesture_str[1:])  # Remove 'G' and convert to int
-                                else:
-                                    gesture_id = int(gesture_str)  # Direct integer
-
-                                transcriptions.append([start_frame, end_frame, gesture_id])
-
-                            except ValueError:
-                                continue  # Skip invalid lines silently
-
-                if transcriptions:
-                    self.transcriptions_data = np.array(transcriptions)
+                # Read the first three columns as strings; short lines are dropped
+                with warnings.catch_warnings():
+                    warnings.simplefilter('ignore')  # Skip invalid lines silently
+                    raw = np.genfromtxt(self.transcriptions_file, dtype=str, usecols=(0, 1, 2),
+                                        invalid_raise=False, encoding='utf-8', ndmin=2)
+                raw = raw.reshape(-1, 3)  # Empty file yields shape (0, 1)
+
+                # Gesture IDs come as G1, G2, ... or plain integers; strip a single 'G'
+                start_frames, end_frames, gesture_ids = raw[:, 0], raw[:, 1], raw[:, 2]
+                gesture_ids = np.where(np.char.startswith(gesture_ids, 'G'),
+                                       np.char.replace(gesture_ids, 'G', '', count=1), gesture_ids)
+
+                # Keep only rows whose frame numbers are (signed) integers and whose
+                # gesture ID is a non-negative integer (-1 is the "no gesture" marker)
+                valid = (_is_integer(start_frames) & _is_integer(end_frames)
+                         & np.char.isdecimal(gesture_ids))
+                transcriptions = np.column_stack(
+                    [start_frames[valid], end_frames[valid], gesture_ids[valid]]
+                ).astype(int)
+
+                if len(transcriptions):
+                    self.transcriptions_data = transcriptions
                     print(f"[OK] Loaded transcriptions: {len(transcriptions)} gestures")
                 else:
                     self.transcriptions_data = None
@@ -115,8 +161,21 @@ class JIGSAWS3DVideoGeneratorEnhanced:
             print(f"[WARNING] Error loading transcriptions: {e}")
             self.transcriptions_data = None
 
+        self._build_gesture_lut()
+
         return self.kinematics_data is not None
 
+    def _build_gesture_lut(self):
+        """Build a per-frame gesture ID lookup table (-1 = no gesture)"""
+        if self.transcriptions_data is None:
+            self.gesture_lut = None
+            return
+
+        self.gesture_lut = np.full(self.frame_count, -1, dtype=np.int16)
+        # Fill in reverse so the first matching transcription row wins on overlap
+        for start, end, gesture_id in self.transcriptions_data[::-1]:
+            self.gesture_lut[max(0, start):max(0, end + 1)] = gesture_id
+
     def extract_manipulator_data(self, manipulator_type):
         """Extract specific manipulator data"""
         if self.kinematics_data is None:
@@ -142,45 +201,89 @@ class JIGSAWS3DVideoGeneratorEnhanced:
         else:
             return None
 
-        return {
-            'positions': self.kinematics_data[:, pos_cols],
-            'velocities': self.kinematics_data[:, vel_cols],
-            'gripper': self.kinematics_data[:, gripper_col],
-            'time': np.arange(len(self.kinematics_data)) / self.fps
-        }
-
-    def get_best_video_writer(self, output_filename):
-        """Get the best available video writer and correct filename"""
-        available_writers = list(animation.writers.list())
-
-        # Priority order: ffmpeg > pillow
-        if 'ffmpeg' in available_writers:
+        # Columns are consecutive, so basic slicing gives views, not copies;
+        # positions are then transposed into one frame-contiguous (3, F) block
+        positions = np.ascontiguousarray(self.kinematics_data[:, pos_cols[0]:pos_cols[-1] + 1].T)
+        velocities = self.kinematics_data[:, vel_cols[0]:vel_cols[-1] + 1]
+
+        return ManipulatorData(
+            positions=positions,
+            pos_x=positions[0],
+            pos_y=positions[1],
+            pos_z=positions[2],
+            vel_speed=np.linalg.norm(velocities, axis=1),
+            gripper=np.ascontiguousarray(self.kinematics_data[:, gripper_col]),
+            time=np.arange(len(self.kinematics_data)) / self.fps
+        )
+
+    def stream_video_ffmpeg(self, frames, output_filename):
+        """Pipe an iterable of (height, width, 4) RGBA frame buffers into a single ffmpeg process"""
+        width, height, frames = _sized_frames(frames)
+        codec = plt.rcParams['animation.codec']
+        bitrate = plt.rcParams['animation.bitrate']
+        extra_args = plt.rcParams['animation.ffmpeg_args']
+        command = [
+            plt.rcParams['animation.ffmpeg_path'], '-y', '-loglevel', 'error',
+            '-f', 'rawvideo', '-vcodec', 'rawvideo', '-s', f'{width}x{height}',
+            '-pix_fmt', 'rgba', '-r', f'{self.fps}/{self.render_stride}', '-i', '-', '-an',
+            '-vcodec', codec
+        ]
+        # Same output defaults as matplotlib's FFMpegWriter, at 1800k unless
+        # animation.bitrate is set
+        if codec == 'h264' and '-pix_fmt' not in extra_args:
+            command += ['-pix_fmt', 'yuv420p']
+        command += ['-b:v', f'{bitrate if bitrate > 0 else 1800}k', *extra_args,
+                    '-metadata', 'artist=JIGSAWS Enhanced Visualizer', output_filename]
+
+        # Buffered stdin: unlike a raw pipe write, BufferedWriter.write always
+        # consumes the whole frame, so a short write cannot misalign the stream
+        with subprocess.Popen(command, stdin=subprocess.PIPE) as proc:
             try:
-                Writer = animation.writers['ffmpeg']
-                writer = Writer(fps=self.fps, metadata=dict(artist='JIGSAWS Enhanced Visualizer'), bitrate=1800)
-                print("Using ffmpeg writer")
-                return writer, output_filename  # Keep original .mp4 extension
-            except Exception:
-                pass
-
-        if 'pillow' in available_writers:
+                for rgba in frames:
+                    proc.stdin.write(rgba)
+            except BaseException:
+                proc.kill()
+                raise
+
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, command[0])
+
+    def save_gif_pillow(self, frames, output_filename):
+        """Write an iterable of (height, width, 4) RGBA frame buffers to an animated GIF with Pillow"""
+        width, height, frames = _sized_frames(frames)
+        # Frames are opaque; RGB quantizes to the GIF palette better than RGBA
+        # (and the conversion copies out of the reused canvas buffer)
+        images = (Image.frombuffer('RGBA', (width, height), rgba, 'raw', 'RGBA', 0, 1).convert('RGB')
+                  for rgba in frames)
+        first = next(images)
+        first.save(output_filename, save_all=True, append_images=images,
+                   duration=int(1000 * self.render_stride / self.fps), loop=0)
+
+    def iter_frames_parallel(self, manipulator_group, frames, workers, chunk_size=4):
+        """Yield RGBA frames in order, rendered in chunks by a pool of worker processes"""
+        chunks = (frames[i:i + chunk_size] for i in range(0, len(frames), chunk_size))
+
+        # Spawn rather than fork: forking while another video's thread holds
+        # locks or pipe handles can deadlock the workers
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_render_worker,
+                                 initargs=(self, manipulator_group, _picklable_rc_params())) as executor:
+            # Bound the chunks in flight: every frame is a full-size RGBA buffer
+            pending = deque(executor.submit(_render_frame_chunk, chunk)
+                            for _, chunk in zip(range(2 * workers), chunks))
             try:
-                Writer = animation.writers['pillow']
-                writer = Writer(fps=self.fps, metadata=dict(artist='JIGSAWS Enhanced Visualizer'))
-                # Change extension to .gif for pillow writer
-                gif_filename = output_filename.replace('.mp4', '.gif')
-                print("Using pillow writer (GIF output)")
-                return writer, gif_filename
-            except Exception:
-                pass
-
-        print("[ERROR] No suitable video writers available")
-        return None, output_filename
-
-    def create_combined_trajectory_video(self, manipulator_group, output_filename):
-        """Create combined 3D trajectory video for left+right manipulators"""
-        print(f"Creating combined 3D video for {manipulator_group}...")
-
+                while pending:
+                    rendered = pending.popleft().result()
+                    next_chunk = next(chunks, None)
+                    if next_chunk is not None:
+                        pending.append(executor.submit(_render_frame_chunk, next_chunk))
+                    yield from rendered
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def build_trajectory_scene(self, manipulator_group, ax=None):
+        """Set up the 3D figure for a manipulator group; returns (fig, animate, num_frames)"""
         # Extract data for both left and right
         if manipulator_group == "master":
             left_data = self.extract_manipulator_data("master_left")
@@ -194,34 +297,37 @@ class JIGSAWS3DVideoGeneratorEnhanced:
             title_suffix = "Slave Tools (Surgical Site)"
         else:
             print(f"[ERROR] Invalid manipulator group: {manipulator_group}")
-            return False
+            return None
 
         if left_data is None or right_data is None:
             print(f"[ERROR] Failed to extract {manipulator_group} data")
-            return False
+            return None
+
+        num_frames = len(left_data.time)
 
-        # Set up the figure and 3D axes
-        fig = plt.figure(figsize=(16, 10))
-        ax = fig.add_subplot(111, projection='3d')
+        # Set up the figure and 3D axes, or wipe and reuse the caller's axes
+        if ax is None:
+            fig = _new_figure()
+            ax = fig.add_subplot(111, projection='3d')
+        else:
+            ax.clear()
+            fig = ax.figure
 
         # Get task configuration
         colors = self.task_configs[self.task]['colors']
 
-        # Combine positions for scaling
-        all_positions = np.vstack([left_data['positions'], right_data['positions']])
-        x_min, x_max = all_positions[:, 0].min(), all_positions[:, 0].max()
-        y_min, y_max = all_positions[:, 1].min(), all_positions[:, 1].max()
-        z_min, z_max = all_positions[:, 2].min(), all_positions[:, 2].max()
+        # Combined bounds of both tools for scaling, without stacking them
+        mins = np.minimum(left_data.positions.min(axis=1), right_data.positions.min(axis=1))
+        maxs = np.maximum(left_data.positions.max(axis=1), right_data.positions.max(axis=1))
 
         # Add padding for better visualization
-        padding = 0.15
-        x_range = x_max - x_min
-        y_range = y_max - y_min
-        z_range = z_max - z_min
+        pad = 0.15 * (maxs - mins)
+        lows = mins - pad
+        highs = maxs + pad
 
-        ax.set_xlim([x_min - padding * x_range, x_max + padding * x_range])
-        ax.set_ylim([y_min - padding * y_range, y_max + padding * y_range])
-        ax.set_zlim([z_min - padding * z_range, z_max + padding * z_range])
+        ax.set_xlim([lows[0], highs[0]])
+        ax.set_ylim([lows[1], highs[1]])
+        ax.set_zlim([lows[2], highs[2]])
 
         # Set labels and title
         ax.set_xlabel('X Position (mm)', fontsize=12)
@@ -235,28 +341,35 @@ class JIGSAWS3DVideoGeneratorEnhanced:
         # Set camera-like view angle
         ax.view_init(elev=view_angle[0], azim=view_angle[1])
 
+        # The camera is fixed for the whole video, so project every position to
+        # 2D once; the animated trail/current artists are then plain 2D lines on
+        # the 3D axes and skip the per-draw mplot3d projection
+        proj_matrix = ax.get_proj()
+        left_2d = _project_positions(left_data.positions, proj_matrix)
+        right_2d = _project_positions(right_data.positions, proj_matrix)
+
         # Initialize plot elements for LEFT manipulator
-        left_trail, = ax.plot([], [], [], '-', color=colors['left'], alpha=0.6, 
-                             linewidth=3, label='Left Tool Trail')
-        left_current, = ax.plot([], [], [], 'o', color=colors['left'], 
-                               markersize=12, markeredgecolor='white', markeredgewidth=2, 
-                               label='Left Tool Current')
-        left_start, = ax.plot([left_data['positions'][0, 0]], 
-                             [left_data['positions'][0, 1]], 
-                             [left_data['positions'][0, 2]], 
+        left_trail = ax.add_line(Line2D([], [], linestyle='-', color=colors['left'], alpha=0.6,
+                                        linewidth=3, label='Left Tool Trail'))
+        left_current = ax.add_line(Line2D([], [], linestyle='none', marker='o', color=colors['left'],
+                                          markersize=12, markeredgecolor='white', markeredgewidth=2,
+                                          label='Left Tool Current'))
+        left_start, = ax.plot([left_data.pos_x[0]], 
+                             [left_data.pos_y[0]], 
+                             [left_data.pos_z[0]], 
                              's', color=colors['left'], markersize=15, 
                              markeredgecolor='black', markeredgewidth=2,
                              alpha=0.8, label='Left Start')
 
         # Initialize plot elements for RIGHT manipulator
-        right_trail, = ax.plot([], [], [], '-', color=colors['right'], alpha=0.6, 
-                              linewidth=3, label='Right Tool Trail')
-        right_current, = ax.plot([], [], [], 'o', color=colors['right'], 
-                                markersize=12, markeredgecolor='white', markeredgewidth=2,
-                                label='Right Tool Current')
-        right_start, = ax.plot([right_data['positions'][0, 0]], 
-                              [right_data['positions'][0, 1]], 
-                              [right_data['positions'][0, 2]], 
+        right_trail = ax.add_line(Line2D([], [], linestyle='-', color=colors['right'], alpha=0.6,
+                                         linewidth=3, label='Right Tool Trail'))
+        right_current = ax.add_line(Line2D([], [], linestyle='none', marker='o', color=colors['right'],
+                                           markersize=12, markeredgecolor='white', markeredgewidth=2,
+                                           label='Right Tool Current'))
+        right_start, = ax.plot([right_data.pos_x[0]], 
+                              [right_data.pos_y[0]], 
+                              [right_data.pos_z[0]], 
                               's', color=colors['right'], markersize=15,
                               markeredgecolor='black', markeredgewidth=2,
                               alpha=0.8, label='Right Start')
@@ -278,6 +391,13 @@ class JIGSAWS3DVideoGeneratorEnhanced:
                                 verticalalignment='top',
                                 bbox=dict(boxstyle='round,pad=0.5', facecolor='lightyellow', alpha=0.9))
 
+        # Only these artists change per frame; marking them animated keeps them
+        # out of the cached background that blitting restores each frame
+        # (start markers too, so they stay drawn above the trails as before)
+        for artist in (left_trail, left_current, left_start, right_trail, right_current,
+                       right_start, time_text, left_info, right_info, gesture_text):
+            artist.set_animated(True)
+
         # Enhanced legend
         ax.legend(loc='upper right', fontsize=10, framealpha=0.9)
 
@@ -299,14 +419,30 @@ class JIGSAWS3DVideoGeneratorEnhanced:
             15: "Final knot adjustment"
         }
 
+        # Gesture label per ID; the trailing "Transition" entry is what a -1
+        # lookup table value indexes to
+        gesture_lut = self.gesture_lut
+        if gesture_lut is not None:
+            max_id = int(self.transcriptions_data[:, 2].max())
+            gesture_strings = [gestures.get(i, f"Gesture {i}") for i in range(max_id + 1)]
+            gesture_strings.append("Transition")
+
         def get_current_gesture(frame_idx):
             """Get current gesture for given frame"""
-            if self.transcriptions_data is None:
+            if gesture_lut is None:
                 return "No gesture data"
-            for start, end, gesture_id in self.transcriptions_data:
-                if start <= frame_idx <= end:
-                    return gestures.get(gesture_id, f"Gesture {gesture_id}")
-            return "Transition"
+            return gesture_strings[gesture_lut[frame_idx]]
+
+        def update_text(artist, text):
+            """Set text only when it changed, skipping a needless text re-layout"""
+            if text != artist.get_text():
+                artist.set_text(text)
+
+        # Per-frame readouts gathered once into plain Python floats: animate()
+        # does one list lookup instead of five NumPy scalar indexings, and
+        # formatting Python floats is cheaper than formatting NumPy scalars
+        frame_state = np.column_stack((left_data.time, left_data.vel_speed, right_data.vel_speed,
+                                       left_data.gripper, right_data.gripper)).tolist()
 
         def animate(frame):
             """Enhanced animation function for combined view"""
@@ -314,81 +450,104 @@ class JIGSAWS3DVideoGeneratorEnhanced:
             trail_start = max(0, frame - self.trail_length)
             trail_end = frame + 1
 
+            # Each trail/marker update is a pair of row-slice views of the (2, F)
+            # projected positions, no temporaries
+
             # Update LEFT manipulator
             if trail_end > trail_start:
-                left_positions = left_data['positions']
-                trail_x = left_positions[trail_start:trail_end, 0]
-                trail_y = left_positions[trail_start:trail_end, 1]
-                trail_z = left_positions[trail_start:trail_end, 2]
-                left_trail.set_data_3d(trail_x, trail_y, trail_z)
-
-            left_current.set_data_3d([left_data['positions'][frame, 0]], 
-                                    [left_data['positions'][frame, 1]], 
-                                    [left_data['positions'][frame, 2]])
+                left_trail.set_data(left_2d[0, trail_start:trail_end], left_2d[1, trail_start:trail_end])
+            left_current.set_data(left_2d[0, frame:trail_end], left_2d[1, frame:trail_end])
 
             # Update RIGHT manipulator
             if trail_end > trail_start:
-                right_positions = right_data['positions']
-                trail_x = right_positions[trail_start:trail_end, 0]
-                trail_y = right_positions[trail_start:trail_end, 1]
-                trail_z = right_positions[trail_start:trail_end, 2]
-                right_trail.set_data_3d(trail_x, trail_y, trail_z)
-
-            right_current.set_data_3d([right_data['positions'][frame, 0]], 
-                                     [right_data['positions'][frame, 1]], 
-                                     [right_data['positions'][frame, 2]])
+                right_trail.set_data(right_2d[0, trail_start:trail_end], right_2d[1, trail_start:trail_end])
+            right_current.set_data(right_2d[0, frame:trail_end], right_2d[1, frame:trail_end])
 
             # Update information displays
-            current_time = left_data['time'][frame]
-            left_vel = np.linalg.norm(left_data['velocities'][frame])
-            right_vel = np.linalg.norm(right_data['velocities'][frame])
-            left_gripper = left_data['gripper'][frame]
-            right_gripper = right_data['gripper'][frame]
+            current_time, left_vel, right_vel, left_gripper, right_gripper = frame_state[frame]
             current_gesture = get_current_gesture(frame)
 
-            # Time and frame info
-            time_text.set_text(f'Time: {current_time:.2f}s | Frame: {frame}/{len(left_data["positions"])-1}\n'
-                              f'Progress: {(frame/len(left_data["positions"])*100):.1f}%')
+            # Time and frame info (changes every frame)
+            time_text.set_text(f'Time: {current_time:.2f}s | Frame: {frame}/{num_frames-1}\n'
+                              f'Progress: {(frame/num_frames*100):.1f}%')
 
             # Left tool info
-            left_info.set_text(f'LEFT TOOL\nVel: {left_vel:.1f} mm/s\nGripper: {left_gripper:.1f}°')
+            update_text(left_info, f'LEFT TOOL\nVel: {left_vel:.1f} mm/s\nGripper: {left_gripper:.1f}°')
 
             # Right tool info  
-            right_info.set_text(f'RIGHT TOOL\nVel: {right_vel:.1f} mm/s\nGripper: {right_gripper:.1f}°')
+            update_text(right_info, f'RIGHT TOOL\nVel: {right_vel:.1f} mm/s\nGripper: {right_gripper:.1f}°')
 
-            # Current gesture
-            gesture_text.set_text(f'Current Gesture:\n{current_gesture}')
+            # Current gesture (changes only at gesture boundaries)
+            update_text(gesture_text, f'Current Gesture:\n{current_gesture}')
 
-            return (left_trail, left_current, right_trail, right_current, 
-                   time_text, left_info, right_info, gesture_text)
+            return (left_trail, left_current, left_start, right_trail, right_current,
+                    right_start, time_text, left_info, right_info, gesture_text)
 
-        # Create animation
-        print(f"Generating combined animation with {len(left_data['positions'])} frames...")
-        anim = animation.FuncAnimation(fig, animate, frames=len(left_data['positions']), 
-                                     interval=1000/self.fps, blit=False, repeat=False)
+        return fig, animate, num_frames
 
-        # Get the best available writer and correct filename
-        writer, corrected_filename = self.get_best_video_writer(output_filename)
-        if writer is None:
-            print("[ERROR] No video writer available")
-            plt.close(fig)
-            return False
+    def create_combined_trajectory_video(self, manipulator_group, output_filename, workers=1, ax=None):
+        """Create combined 3D trajectory video for left+right manipulators"""
+        print(f"Creating combined 3D video for {manipulator_group}...")
+
+        if workers > 1:
+            # Each worker builds and draws its own scene; the parent only needs
+            # the frame count (the frame size comes with the rendered frames)
+            if manipulator_group not in ("master", "slave"):
+                print(f"[ERROR] Invalid manipulator group: {manipulator_group}")
+                return False
+            num_frames = self.frame_count
+        else:
+            scene = self.build_trajectory_scene(manipulator_group, ax)
+            if scene is None:
+                return False
+            fig, animate, num_frames = scene
 
-        # Save video
-        print(f"Saving combined video: {corrected_filename}")
+        # Temporal subsampling: source frames actually rendered into the video
+        frames = range(0, num_frames, self.render_stride)
+
+        print(f"Generating combined animation with {len(frames)} frames...")
 
         try:
-            anim.save(corrected_filename, writer=writer)
-            print(f"[OK] Combined video saved successfully: {corrected_filename}")
+            if workers > 1:
+                print(f"Rendering frames with {workers} worker processes")
+            else:
+                # Axes panes, grid, ticks, labels and legend are drawn once into
+                # the cached background; frames only redraw animated artists
+                background = _draw_background(fig)
+
+            def render_frames():
+                """Fresh iterator over the rendered RGBA frames"""
+                if workers > 1:
+                    return self.iter_frames_parallel(manipulator_group, frames, workers)
+                return (_render_frame(fig, animate, background, frame) for frame in frames)
+
+            # Priority order: ffmpeg > pillow
+            use_gif = 'ffmpeg' not in animation.writers.list()
+            if not use_gif:
+                # Stream raw frames straight into ffmpeg (no per-frame PNG encode)
+                print(f"Streaming raw frames to ffmpeg: {output_filename}")
+                try:
+                    self.stream_video_ffmpeg(render_frames(), output_filename)
+                except (subprocess.CalledProcessError, BrokenPipeError) as e:
+                    # e.g. an ffmpeg build without the configured codec
+                    print(f"[WARNING] ffmpeg failed ({e}), falling back to pillow")
+                    Path(output_filename).unlink(missing_ok=True)
+                    use_gif = True
+
+            if use_gif:
+                # Change extension to .gif for pillow output
+                output_filename = output_filename.replace('.mp4', '.gif')
+                print(f"Using pillow (GIF output): {output_filename}")
+                self.save_gif_pillow(render_frames(), output_filename)
+
+            print(f"[OK] Combined video saved successfully: {output_filename}")
             return True
 
         except Exception as e:
             print(f"[ERROR] Error saving video: {e}")
             return False
-        finally:
-            plt.close(fig)
 
-    def create_all_videos(self, output_dir="jigsaws_3d_videos_enhanced"):
+    def create_all_videos(self, output_dir="jigsaws_3d_videos_enhanced", workers=1):
         """Create enhanced combined videos for master and slave manipulators"""
         if not self.load_data():
             return False
@@ -402,27 +561,41 @@ class JIGSAWS3DVideoGeneratorEnhanced:
         success_count = 0
         created_files = []
 
-        # Create master combined video (left + right hands at console)
-        master_output = output_path / f"{self.task}_{self.subject_id}_master_combined.mp4"
-        if self.create_combined_trajectory_video("master", str(master_output)):
-            success_count += 1
-            # Check what file was actually created
-            gif_file = master_output.with_suffix('.gif')
-            if gif_file.exists():
-                created_files.append(str(gif_file))
-            elif master_output.exists():
-                created_files.append(str(master_output))
-
-        # Create slave combined video (left + right tools in surgical site)
-        slave_output = output_path / f"{self.task}_{self.subject_id}_slave_combined.mp4"
-        if self.create_combined_trajectory_video("slave", str(slave_output)):
-            success_count += 1
-            # Check what file was actually created
-            gif_file = slave_output.with_suffix('.gif')
-            if gif_file.exists():
-                created_files.append(str(gif_file))
-            elif slave_output.exists():
-                created_files.append(str(slave_output))
+        # Master combined video (left + right hands at console) and slave
+        # combined video (left + right tools in surgical site)
+        jobs = [
+            ("master", output_path / f"{self.task}_{self.subject_id}_master_combined.mp4"),
+            ("slave", output_path / f"{self.task}_{self.subject_id}_slave_combined.mp4"),
+        ]
+
+        # Split the worker processes between the videos without exceeding the
+        # requested count; with fewer than two each, render in-process instead
+        video_workers = max(1, workers // len(jobs))
+        if video_workers > 1:
+            # Frames come from worker processes, so each video's thread mostly
+            # waits on the pool and the ffmpeg pipe; render both concurrently,
+            # each on its own figure
+            with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+                futures = [executor.submit(self.create_combined_trajectory_video,
+                                           group, str(output), video_workers)
+                           for group, output in jobs]
+                results = [future.result() for future in futures]
+        else:
+            # Share one figure between both videos so figure, 3D axes and font
+            # setup are paid once
+            ax = _new_figure().add_subplot(111, projection='3d')
+            results = [self.create_combined_trajectory_video(group, str(output), 1, ax)
+                       for group, output in jobs]
+
+        for (group, output), success in zip(jobs, results):
+            if success:
+                success_count += 1
+                # Check what file was actually created
+                gif_file = output.with_suffix('.gif')
+                if gif_file.exists():
+                    created_files.append(str(gif_file))
+                elif output.exists():
+                    created_files.append(str(output))
 
         print(f"\n[OK] Successfully created {success_count}/2 enhanced videos")
         print(f"[FOLDER] Videos saved in: {output_path.absolute()}")
@@ -439,7 +612,10 @@ class JIGSAWS3DVideoGeneratorEnhanced:
 
     def create_video_summary(self, output_path, created_files):
         """Create a summary report of generated videos - FIXED VERSION"""
-        summary = f"""# JIGSAWS Enhanced 3D Visualization Summary
+        # Rendered frames are every render_stride-th source frame
+        output_fps = self.fps / self.render_stride
+
+        header = f"""# JIGSAWS Enhanced 3D Visualization Summary
 
 ## Task: {self.task}
 ## Subject: {self.subject_id} 
@@ -454,18 +630,12 @@ class JIGSAWS3DVideoGeneratorEnhanced:
 [OK] Gesture labeling with timeline
 [OK] Professional presentation quality
 
-## Files Created:
-"""
-        for file_path in created_files:
-            filename = Path(file_path).name
-            if 'master' in filename:
-                summary += f"[HANDS] {filename} - Surgeon hand movements at console\n"
-            else:
-                summary += f"[TOOLS] {filename} - Robot tool movements in surgical site\n"
+## Files Created:"""
 
-        summary += f"""
+        footer = f"""
 ## Video Specifications:
-- Frame Rate: {self.fps} fps
+- Frame Rate: {output_fps:g} fps
+- Render Stride: every {self.render_stride} frame(s)
 - Trail Length: {self.trail_length} points
 - View Angles: Master {self.task_configs[self.task]['master_view']}, Slave {self.task_configs[self.task]['slave_view']}
 - Colors: {self.task_configs[self.task]['colors']}
@@ -475,21 +645,103 @@ class JIGSAWS3DVideoGeneratorEnhanced:
 2. Use in presentation alongside camera footage
 3. Recommended layout: [Camera Left] [Camera Right]
                        [Master Combined] [Slave Combined]
-4. Perfect synchronization maintained at {self.fps} fps
+4. Perfect synchronization maintained at {output_fps:g} fps
 
 ## Task Description: 
 {self.task_configs[self.task]['description']}
 """
 
+        # Collect lines and join once instead of growing the string with +=
+        lines = [header]
+        lines.extend(
+            f"[HANDS] {name} - Surgeon hand movements at console" if 'master' in name
+            else f"[TOOLS] {name} - Robot tool movements in surgical site"
+            for name in (Path(file_path).name for file_path in created_files)
+        )
+        lines.append(footer)
+        summary = "\n".join(lines)
+
         # FIXED: Use UTF-8 encoding to handle any Unicode characters
         try:
-            with open(output_path / "video_summary.txt", 'w', encoding='utf-8') as f:
-                f.write(summary)
+            (output_path / "video_summary.txt").write_text(summary, encoding='utf-8')
             print("[OK] Created video summary report")
         except Exception as e:
             print(f"[WARNING] Could not create summary file: {e}")
             # Continue without summary file - videos are still created successfully
 
+def _is_integer(strings):
+    """Elementwise test for int()-style decimal integers with an optional sign"""
+    unsigned = strings
+    for sign in '-+':
+        unsigned = np.where(np.char.startswith(strings, sign),
+                            np.char.replace(strings, sign, '', count=1), unsigned)
+    return np.char.isdecimal(unsigned)
+
+def _new_figure():
+    """Create a pyplot-free Agg figure, safe to build and render off the main thread"""
+    fig = Figure(figsize=(16, 10))
+    FigureCanvasAgg(fig)
+    return fig
+
+def _project_positions(positions, proj_matrix):
+    """Project (3, F) positions through a 4x4 mplot3d camera matrix to (2, F)"""
+    homogeneous = np.vstack((positions, np.ones(positions.shape[1], dtype=positions.dtype)))
+    x, y, _, w = proj_matrix @ homogeneous
+    return np.stack((x / w, y / w))
+
+def _sized_frames(frames):
+    """Return (width, height, frames) from the first RGBA frame, checking every frame matches it"""
+    frames = iter(frames)
+    first = next(frames, None)
+    if first is None:
+        raise ValueError("No frames to encode")
+    shape = first.shape
+    if len(shape) != 3 or shape[2] != 4:
+        raise ValueError(f"Expected (height, width, 4) RGBA frames, got shape {shape}")
+
+    def checked_frames():
+        """Pass frames through, refusing any whose size would misalign the stream"""
+        for rgba in chain([first], frames):
+            if rgba.shape != shape:
+                raise ValueError(f"Frame shape {rgba.shape} does not match video frame shape {shape}")
+            yield rgba
+
+    return shape[1], shape[0], checked_frames()
+
+def _draw_background(fig):
+    """Fully draw a figure (animated artists are skipped) and cache it for blitting"""
+    fig.canvas.draw()
+    return fig.canvas.copy_from_bbox(fig.bbox)
+
+def _render_frame(fig, animate, background, frame):
+    """Blit one frame over the cached background and return the canvas RGBA buffer"""
+    fig.canvas.restore_region(background)
+    for artist in animate(frame):
+        fig.draw_artist(artist)
+    return fig.canvas.buffer_rgba()
+
+# Per-process scene used by the parallel frame renderer (set by _init_render_worker)
+_worker_scene = {}
+
+def _picklable_rc_params():
+    """Copy the current rcParams for a spawned worker (the backend stays per-process)"""
+    return {key: plt.rcParams[key] for key in plt.rcParams if key != 'backend'}
+
+def _init_render_worker(generator, manipulator_group, rc_params):
+    """Build this worker process's own figure and cache its static background"""
+    # Spawned workers start from default rcParams; match the parent's figure
+    # size, dpi and styling so parallel and in-process frames are identical
+    plt.rcParams.update(rc_params)
+    fig, animate, _ = generator.build_trajectory_scene(manipulator_group)
+    _worker_scene.update(fig=fig, animate=animate, background=_draw_background(fig))
+
+def _render_frame_chunk(frames):
+    """Render a chunk of frame indices in a worker process as (height, width, 4) RGBA arrays"""
+    fig, animate, background = (_worker_scene['fig'], _worker_scene['animate'],
+                                _worker_scene['background'])
+    return [np.array(_render_frame(fig, animate, background, frame))
+            for frame in frames]
+
 def main():
     """Main function for enhanced JIGSAWS video generation"""
 
@@ -509,6 +761,12 @@ def main():
     task = "Needle_Passing"  # Options: "Suturing", "Needle_Passing", "Knot_Tying"
     subject_id = "I005"
 
+    # Render every Nth frame (1 = all); playback stays real-time
+    render_stride = 1
+
+    # Worker processes for parallel frame rendering (1 = render in this process)
+    workers = os.cpu_count() or 1
+
     # Construct full path for selected task
     full_path = Path(base_path) / task
 
@@ -517,7 +775,7 @@ def main():
     print(f"[PATH] Data Path: {full_path}")
 
     # Create the enhanced generator
-    generator = JIGSAWS3DVideoGeneratorEnhanced(full_path, subject_id, task)
+    generator = JIGSAWS3DVideoGeneratorEnhanced(full_path, subject_id, task, render_stride)
 
     # Check if required files exist
     print("\n[CHECK] Checking for required files...")
@@ -536,7 +794,7 @@ def main():
 
     # Generate enhanced videos
     print("\n[START] Generating enhanced 3D videos...")
-    success = generator.create_all_videos()
+    success = generator.create_all_videos(workers=workers)
 
     if success:
         print("\n[SUCCESS] Enhanced 3D videos created!")